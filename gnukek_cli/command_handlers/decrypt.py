@@ -1,13 +1,31 @@
 import logging
 from dataclasses import dataclass
-from typing import BinaryIO
+from typing import BinaryIO, Iterator
 
 from dependency_injector.wiring import Provide, inject
-from gnukek.constants import CHUNK_LENGTH
-from gnukek.utils import extract_key_id, preprocess_encrypted_stream
-
+from gnukek.constants import CHUNK_LENGTH, KEY_ID_SLICE
+from gnukek.exceptions import DecryptionError
+from gnukek.helpers import validate_supported_algorithm_version
+from gnukek.keys import KeyPair
+from gnukek.utils import PreprocessedEncryptedStream, extract_key_id
+
+from gnukek_cli.constants import (
+    DEFAULT_JOBS,
+    PIPELINE_QUEUE_DEPTH,
+    WRITE_BATCH_LENGTH,
+)
 from gnukek_cli.container import Container
+from gnukek_cli.crypto import symmetric
+from gnukek_cli.crypto.envelope import (
+    EnvelopeHeader,
+    is_envelope,
+    read_encrypted_stream_header,
+    split_envelope,
+)
+from gnukek_cli.crypto.symmetric import SymmetricKey
 from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.buffers import map_file, read_ahead, write_behind
+from gnukek_cli.utils.exceptions import KeyNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +35,8 @@ class DecryptContext:
     input_file: BinaryIO
     output_file: BinaryIO
     chunk_length: int = CHUNK_LENGTH
+    jobs: int = DEFAULT_JOBS
+    pipeline: bool = True
 
 
 class DecryptHandler:
@@ -40,29 +60,99 @@ class DecryptHandler:
             self._decrypt_inplace()
 
     def _decrypt_chunked(self) -> None:
-        preprocessed_stream = preprocess_encrypted_stream(self.context.input_file)
+        queue_depth = PIPELINE_QUEUE_DEPTH if self.context.pipeline else 0
+        with read_ahead(
+            self.context.input_file,
+            chunk_length=self.context.chunk_length,
+            depth=queue_depth,
+        ) as input_file, write_behind(
+            self.context.output_file,
+            depth=queue_depth,
+            batch_length=max(self.context.chunk_length, WRITE_BATCH_LENGTH),
+        ) as output_file:
+            symmetric_key = self._read_symmetric_key(input_file)
+            self._decrypt_body(symmetric_key, input_file, output_file)
+
+        logger.debug("Decryption finished")
+
+    def _read_symmetric_key(self, input_file: BinaryIO) -> SymmetricKey:
+        header = read_encrypted_stream_header(input_file)
+
+        if isinstance(header, EnvelopeHeader):
+            return self._unwrap_envelope_key(header)
 
-        key_id = preprocessed_stream.key_id.hex()
+        key_id = header.key_id.hex()
         logger.info(f"Data is encrypted with key: {key_id}")
         key_pair = self._key_provider.get_key_pair(key_id)
 
-        decryption_iterator = key_pair.decrypt_stream(
-            preprocessed_stream, chunk_length=self.context.chunk_length
+        validate_supported_algorithm_version(header.algorithm_version)
+        wrapped_key = input_file.read(symmetric.get_wrapped_key_length(key_pair))
+        return symmetric.unwrap_symmetric_key(key_pair, wrapped_key)
+
+    def _decrypt_body(
+        self,
+        symmetric_key: SymmetricKey,
+        input_file: BinaryIO,
+        output_file: BinaryIO,
+    ) -> None:
+        if self.context.jobs > 1:
+            logger.debug(f"Decrypting up to {self.context.jobs} chunks in parallel")
+            for chunk in symmetric.decrypt_stream_parallel(
+                symmetric_key,
+                input_file,
+                chunk_length=self.context.chunk_length,
+                jobs=self.context.jobs,
+            ):
+                output_file.write(chunk)
+        else:
+            symmetric.decrypt_into(
+                symmetric_key,
+                input_file,
+                output_file,
+                chunk_length=self.context.chunk_length,
+            )
+
+    def _unwrap_envelope_key(self, header: EnvelopeHeader) -> SymmetricKey:
+        logger.info(
+            "Data is encrypted for keys: "
+            + ", ".join(key_id.hex() for key_id in header.key_ids)
         )
-        for chunk in decryption_iterator:
-            self.context.output_file.write(chunk)
 
-        logger.debug("Decryption finished")
+        for recipient in header.recipients:
+            key_id = recipient.key_id.hex()
+            if self._key_provider.has_key_pair(key_id):
+                logger.info(f"Using key: {key_id}")
+                key_pair = self._key_provider.get_key_pair(key_id)
+                return symmetric.unwrap_symmetric_key(key_pair, recipient.wrapped_key)
+
+        raise KeyNotFoundError(" or ".join(key_id.hex() for key_id in header.key_ids))
 
     def _decrypt_inplace(self) -> None:
-        encrypted_content = self.context.input_file.read()
+        with map_file(self.context.input_file) as encrypted_content:
+            if is_envelope(encrypted_content):
+                header, body = split_envelope(encrypted_content)
+                symmetric_key = self._unwrap_envelope_key(header)
+                decrypted_content = symmetric.decrypt(symmetric_key, body)
+            else:
+                decrypted_content = self._decrypt_kek_content(encrypted_content)
+
+        self.context.output_file.write(decrypted_content)
+
+        logger.debug("Decryption finished")
+
+    def _decrypt_kek_content(self, encrypted_content: bytes) -> bytes:
+        # Same as KeyPair.decrypt(), but avoids copying memory-mapped content
+        if len(encrypted_content) < KEY_ID_SLICE.stop:
+            raise DecryptionError("Failed to extract key id")
 
         key_id_bytes = extract_key_id(encrypted_content)
         key_id = key_id_bytes.hex()
         logger.info(f"Data is encrypted with key: {key_id}")
         key_pair = self._key_provider.get_key_pair(key_id)
 
-        decrypted_content = key_pair.decrypt(encrypted_content)
-        self.context.output_file.write(decrypted_content)
+        validate_supported_algorithm_version(encrypted_content[0])
+        wrapped_key_end = KEY_ID_SLICE.stop + symmetric.get_wrapped_key_length(key_pair)
+        wrapped_key = bytes(encrypted_content[KEY_ID_SLICE.stop : wrapped_key_end])
+        symmetric_key = symmetric.unwrap_symmetric_key(key_pair, wrapped_key)
 
-        logger.debug("Decryption finished")
+        return symmetric.decrypt(symmetric_key, encrypted_content[wrapped_key_end:])
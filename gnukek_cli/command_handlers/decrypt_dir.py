@@ -0,0 +1,55 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from dependency_injector.wiring import Provide, inject
+from gnukek.constants import CHUNK_LENGTH
+
+from gnukek_cli.command_handlers.decrypt import DecryptContext, DecryptHandler
+from gnukek_cli.constants import DEFAULT_JOBS
+from gnukek_cli.container import Container
+from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.directories import process_directory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DecryptDirContext:
+    source_dir: Path
+    destination_dir: Path
+    chunk_length: int = CHUNK_LENGTH
+    jobs: int = DEFAULT_JOBS
+
+
+class DecryptDirHandler:
+    @inject
+    def __init__(
+        self,
+        context: DecryptDirContext,
+        *,
+        key_provider: KeyProvider = Provide[Container.key_provider],
+    ) -> None:
+        self.context = context
+        self._key_provider = key_provider
+
+    def __call__(self) -> None:
+        files_count = process_directory(
+            self.context.source_dir,
+            self.context.destination_dir,
+            self._decrypt_file,
+            jobs=self.context.jobs,
+        )
+        logger.info(f"Decrypted {files_count} files")
+
+    def _decrypt_file(self, input_file: BinaryIO, output_file: BinaryIO) -> None:
+        context = DecryptContext(
+            input_file=input_file,
+            output_file=output_file,
+            chunk_length=self.context.chunk_length,
+            # Files are already processed in parallel by the pool
+            pipeline=False,
+        )
+        handle = DecryptHandler(context, key_provider=self._key_provider)
+        handle()
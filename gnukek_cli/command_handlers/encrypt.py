@@ -1,12 +1,23 @@
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import BinaryIO
 
 from dependency_injector.wiring import Provide, inject
+from gnukek.backends.encryption import EncryptionBackend
 from gnukek.constants import CHUNK_LENGTH, LATEST_KEK_VERSION
 
+from gnukek_cli.constants import (
+    DEFAULT_JOBS,
+    PIPELINE_QUEUE_DEPTH,
+    WRITE_BATCH_LENGTH,
+)
 from gnukek_cli.container import Container
+from gnukek_cli.crypto.envelope import EnvelopeEncryptor
+from gnukek_cli.crypto.symmetric import SymmetricEncryptor
+from gnukek_cli.crypto.v1 import V1Encryptor
 from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.buffers import map_file, read_ahead, write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +29,9 @@ class EncryptContext:
     key_id: str | None = None
     chunk_length: int = CHUNK_LENGTH
     version: int = LATEST_KEK_VERSION
+    jobs: int = DEFAULT_JOBS
+    additional_key_ids: Sequence[str] = ()
+    pipeline: bool = True
 
 
 class EncryptHandler:
@@ -32,28 +46,76 @@ class EncryptHandler:
         self._key_provider = key_provider
 
     def __call__(self) -> None:
-        public_key = self._key_provider.get_public_key(self.context.key_id)
-
-        logger.info(f"Using key: {public_key.key_id.hex()}")
-        logger.debug(f"Using v{self.context.version} encryption")
-
-        encryptor = public_key.get_encryptor(version=self.context.version)
+        encryptor = self._get_encryptor()
         metadata = encryptor.get_metadata()
 
         if self.context.chunk_length:
             logger.debug("Using chunk encryption")
             logger.debug(f"Chunk size: {self.context.chunk_length}")
-            self.context.output_file.write(metadata)
-            for chunk in encryptor.encrypt_stream(
+            with read_ahead(
                 self.context.input_file,
                 chunk_length=self.context.chunk_length,
-            ):
-                self.context.output_file.write(chunk)
+                depth=self._get_read_ahead_depth(),
+            ) as input_file, write_behind(
+                self.context.output_file,
+                depth=self._get_write_behind_depth(),
+                batch_length=max(self.context.chunk_length, WRITE_BATCH_LENGTH),
+            ) as output_file:
+                output_file.write(metadata)
+                self._encrypt_stream(encryptor, input_file, output_file)
         else:
             logger.debug("Using inplace encryption")
-            original_content = self.context.input_file.read()
-            encrypted_content = encryptor.encrypt(original_content)
+            with map_file(self.context.input_file) as original_content:
+                encrypted_content = encryptor.encrypt(original_content)
             self.context.output_file.write(metadata)
             self.context.output_file.write(encrypted_content)
 
         logger.debug("Encryption finished")
+
+    def _encrypt_stream(
+        self,
+        encryptor: EncryptionBackend | SymmetricEncryptor,
+        input_file: BinaryIO,
+        output_file: BinaryIO,
+    ) -> None:
+        if isinstance(encryptor, SymmetricEncryptor):
+            encryptor.encrypt_into(
+                input_file, output_file, chunk_length=self.context.chunk_length
+            )
+            return
+
+        for chunk in encryptor.encrypt_stream(
+            input_file, chunk_length=self.context.chunk_length
+        ):
+            output_file.write(chunk)
+
+    def _get_encryptor(self) -> EncryptionBackend | SymmetricEncryptor:
+        public_key = self._key_provider.get_public_key(self.context.key_id)
+        public_keys = {public_key.key_id: public_key}
+        for key_id in self.context.additional_key_ids:
+            additional_public_key = self._key_provider.get_public_key(key_id)
+            public_keys[additional_public_key.key_id] = additional_public_key
+
+        if len(public_keys) > 1:
+            key_ids = ", ".join(key_id.hex() for key_id in public_keys)
+            logger.info(f"Using keys: {key_ids}")
+            logger.debug("Using envelope encryption")
+            return EnvelopeEncryptor(public_keys.values())
+
+        logger.info(f"Using key: {public_key.key_id.hex()}")
+        logger.debug(f"Using v{self.context.version} encryption")
+        if self.context.version == V1Encryptor.version:
+            return V1Encryptor(public_key)
+        return public_key.get_encryptor(version=self.context.version)
+
+    def _get_read_ahead_depth(self) -> int:
+        if not self.context.pipeline:
+            return 0
+        # CBC chaining makes every chunk depend on the previous ciphertext block,
+        # so extra jobs are spent on reading chunks ahead of the cipher instead.
+        depth = max(self.context.jobs, PIPELINE_QUEUE_DEPTH)
+        logger.debug(f"Reading up to {depth} chunks ahead")
+        return depth
+
+    def _get_write_behind_depth(self) -> int:
+        return PIPELINE_QUEUE_DEPTH if self.context.pipeline else 0
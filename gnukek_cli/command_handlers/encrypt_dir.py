@@ -0,0 +1,63 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from dependency_injector.wiring import Provide, inject
+from gnukek.constants import CHUNK_LENGTH, LATEST_KEK_VERSION
+
+from gnukek_cli.command_handlers.encrypt import EncryptContext, EncryptHandler
+from gnukek_cli.constants import DEFAULT_JOBS
+from gnukek_cli.container import Container
+from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.directories import process_directory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EncryptDirContext:
+    source_dir: Path
+    destination_dir: Path
+    key_id: str | None = None
+    chunk_length: int = CHUNK_LENGTH
+    version: int = LATEST_KEK_VERSION
+    jobs: int = DEFAULT_JOBS
+
+
+class EncryptDirHandler:
+    @inject
+    def __init__(
+        self,
+        context: EncryptDirContext,
+        *,
+        key_provider: KeyProvider = Provide[Container.key_provider],
+    ) -> None:
+        self.context = context
+        self._key_provider = key_provider
+
+    def __call__(self) -> None:
+        public_key = self._key_provider.get_public_key(self.context.key_id)
+        self._key_id = public_key.key_id.hex()
+        logger.info(f"Using key: {self._key_id}")
+
+        files_count = process_directory(
+            self.context.source_dir,
+            self.context.destination_dir,
+            self._encrypt_file,
+            jobs=self.context.jobs,
+        )
+        logger.info(f"Encrypted {files_count} files")
+
+    def _encrypt_file(self, input_file: BinaryIO, output_file: BinaryIO) -> None:
+        context = EncryptContext(
+            input_file=input_file,
+            output_file=output_file,
+            key_id=self._key_id,
+            chunk_length=self.context.chunk_length,
+            version=self.context.version,
+            # Files are already processed in parallel by the pool
+            pipeline=False,
+        )
+        handle = EncryptHandler(context, key_provider=self._key_provider)
+        handle()
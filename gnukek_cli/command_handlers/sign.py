@@ -5,8 +5,10 @@ from typing import BinaryIO
 from dependency_injector.wiring import Provide, inject
 from gnukek.constants import CHUNK_LENGTH
 
+from gnukek_cli.constants import PIPELINE_QUEUE_DEPTH
 from gnukek_cli.container import Container
 from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.buffers import iter_chunks, map_file, read_ahead
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,7 @@ class SignContext:
     output_file: BinaryIO
     key_id: str | None = None
     chunk_length: int = CHUNK_LENGTH
+    pipeline: bool = True
 
 
 class SignHandler:
@@ -37,13 +40,18 @@ class SignHandler:
         if self.context.chunk_length:
             logger.debug("Using chunk signing")
             logger.debug(f"Chunk size: {self.context.chunk_length}")
-            signature = key_pair.sign_stream(
-                self.context.input_file, chunk_size=self.context.chunk_length
-            )
+            with read_ahead(
+                self.context.input_file,
+                chunk_length=self.context.chunk_length,
+                depth=PIPELINE_QUEUE_DEPTH if self.context.pipeline else 0,
+            ) as input_file:
+                signature = key_pair.sign_iterable(
+                    iter_chunks(input_file, chunk_length=self.context.chunk_length)
+                )
         else:
             logger.debug("Using inplace signing")
-            content = self.context.input_file.read()
-            signature = key_pair.sign(content)
+            with map_file(self.context.input_file) as content:
+                signature = key_pair.sign(content)
 
         self.context.output_file.write(signature)
         logger.debug("Signature written")
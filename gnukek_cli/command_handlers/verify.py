@@ -8,6 +8,7 @@ from gnukek.exceptions import VerificationError
 
 from gnukek_cli.container import Container
 from gnukek_cli.keys.provider import KeyProvider
+from gnukek_cli.utils.buffers import iter_chunks, map_file
 
 logger = logging.getLogger(__name__)
 
@@ -40,17 +41,16 @@ class VerifyHandler:
         if self.context.chunk_length:
             logger.debug("Using chunk processing")
             logger.debug(f"Chunk size: {self.context.chunk_length}")
-            is_valid = public_key.verify_stream(
+            is_valid = public_key.verify_iterable(
                 signature,
-                buffer=self.context.original_file,
-                chunk_length=self.context.chunk_length,
+                iterable=iter_chunks(
+                    self.context.original_file, chunk_length=self.context.chunk_length
+                ),
             )
         else:
             logger.debug("Using inplace processing")
-            is_valid = public_key.verify(
-                signature,
-                message=self.context.original_file.read(),
-            )
+            with map_file(self.context.original_file) as message:
+                is_valid = public_key.verify(signature, message=message)
 
         logger.debug(f"Signature verified: {is_valid}")
         if not is_valid:
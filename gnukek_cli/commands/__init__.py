@@ -1,7 +1,9 @@
 from .decrypt import decrypt  # noqa: F401
+from .decrypt_dir import decrypt_dir  # noqa: F401
 from .delete_key import delete_key  # noqa: F401
 from .edit import edit  # noqa: F401
 from .encrypt import encrypt  # noqa: F401
+from .encrypt_dir import encrypt_dir  # noqa: F401
 from .export import export  # noqa: F401
 from .generate import generate  # noqa: F401
 from .import_keys import import_keys  # noqa: F401
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from io import FileIO
 from pathlib import Path
 
@@ -5,6 +6,8 @@ import click
 from gnukek.constants import CHUNK_LENGTH
 
 from gnukek_cli.command_handlers.decrypt import DecryptContext, DecryptHandler
+from gnukek_cli.constants import DEFAULT_JOBS
+from gnukek_cli.utils.files import atomic_write
 
 
 @click.command()
@@ -17,21 +20,33 @@ from gnukek_cli.command_handlers.decrypt import DecryptContext, DecryptHandler
     show_default=True,
     help="chunk size in bytes, use 0 to disable chunk encryption",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="number of chunks to decrypt in parallel",
+)
 def decrypt(
     input_file: FileIO,
     output_file: FileIO,
     chunk_size,
+    jobs,
 ):
     """Decrypt single file."""
 
-    is_inplace_decryption = (
-        Path(input_file.name).resolve() == Path(output_file.name).resolve()
-    )
+    output_path = Path(output_file.name)
+    is_inplace_decryption = Path(input_file.name).resolve() == output_path.resolve()
 
-    context = DecryptContext(
-        input_file=input_file,
-        output_file=output_file,
-        chunk_length=chunk_size if not is_inplace_decryption else 0,
-    )
-    handle = DecryptHandler(context)
-    handle()
+    with (
+        atomic_write(output_path) if is_inplace_decryption else nullcontext(output_file)
+    ) as output:
+        context = DecryptContext(
+            input_file=input_file,
+            output_file=output,
+            chunk_length=chunk_size,
+            jobs=jobs,
+        )
+        handle = DecryptHandler(context)
+        handle()
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import click
+from gnukek.constants import CHUNK_LENGTH
+
+from gnukek_cli.command_handlers.decrypt_dir import DecryptDirContext, DecryptDirHandler
+from gnukek_cli.constants import DEFAULT_JOBS
+
+
+@click.command("decrypt-dir")
+@click.argument(
+    "source_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.argument("destination_dir", type=click.Path(file_okay=False, path_type=Path))
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=CHUNK_LENGTH,
+    show_default=True,
+    help="chunk size in bytes, use 0 to disable chunk encryption",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="number of files to decrypt in parallel",
+)
+def decrypt_dir(source_dir: Path, destination_dir: Path, chunk_size, jobs) -> None:
+    """Decrypt all files in directory."""
+
+    context = DecryptDirContext(
+        source_dir=source_dir,
+        destination_dir=destination_dir,
+        chunk_length=chunk_size,
+        jobs=jobs,
+    )
+    handle = DecryptDirHandler(context)
+    handle()
@@ -7,6 +7,7 @@ from gnukek.constants import LATEST_KEK_VERSION
 from gnukek_cli.command_handlers.decrypt import DecryptContext, DecryptHandler
 from gnukek_cli.command_handlers.encrypt import EncryptContext, EncryptHandler
 from gnukek_cli.utils.completions import KeyIdParam
+from gnukek_cli.utils.files import atomic_write
 
 DEFAULT_FILE_EXTENSION = ".md"
 
@@ -42,7 +43,7 @@ def edit(file_path: Path, key, version, extension: str | None) -> None:
     edited_text = click.edit(decrypted_content.getvalue(), extension=editor_extension)
 
     if edited_text:
-        with open(file_path, "wb") as file:
+        with atomic_write(file_path) as file:
             encryption_context = EncryptContext(
                 input_file=BytesIO(edited_text),
                 output_file=file,
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from io import FileIO
 from pathlib import Path
 
@@ -5,13 +6,22 @@ import click
 from gnukek.constants import CHUNK_LENGTH, LATEST_KEK_VERSION
 
 from gnukek_cli.command_handlers.encrypt import EncryptContext, EncryptHandler
+from gnukek_cli.constants import DEFAULT_JOBS
 from gnukek_cli.utils.completions import KeyIdParam
+from gnukek_cli.utils.files import atomic_write
 
 
 @click.command()
 @click.argument("input_file", type=click.File("rb"))
 @click.argument("output_file", type=click.File("wb"), default="-")
-@click.option("-k", "--key", type=KeyIdParam(), help="key id to use")
+@click.option(
+    "-k",
+    "--key",
+    "keys",
+    type=KeyIdParam(),
+    multiple=True,
+    help="key id to use, repeat to encrypt for several keys",
+)
 @click.option(
     "--chunk-size",
     type=int,
@@ -26,25 +36,38 @@ from gnukek_cli.utils.completions import KeyIdParam
     show_default=True,
     help="algorithm version to use",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="number of chunks to read ahead while encrypting",
+)
 def encrypt(
     input_file: FileIO,
     output_file: FileIO,
-    key,
+    keys,
     chunk_size,
     version,
+    jobs,
 ) -> None:
     """Encrypt single file."""
 
-    is_inplace_encryption = (
-        Path(input_file.name).resolve() == Path(output_file.name).resolve()
-    )
+    output_path = Path(output_file.name)
+    is_inplace_encryption = Path(input_file.name).resolve() == output_path.resolve()
 
-    context = EncryptContext(
-        input_file=input_file,
-        output_file=output_file,
-        key_id=key,
-        chunk_length=chunk_size if not is_inplace_encryption else 0,
-        version=version,
-    )
-    handle = EncryptHandler(context)
-    handle()
+    with (
+        atomic_write(output_path) if is_inplace_encryption else nullcontext(output_file)
+    ) as output:
+        context = EncryptContext(
+            input_file=input_file,
+            output_file=output,
+            key_id=keys[0] if keys else None,
+            additional_key_ids=keys[1:],
+            chunk_length=chunk_size,
+            version=version,
+            jobs=jobs,
+        )
+        handle = EncryptHandler(context)
+        handle()
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import click
+from gnukek.constants import CHUNK_LENGTH, LATEST_KEK_VERSION
+
+from gnukek_cli.command_handlers.encrypt_dir import EncryptDirContext, EncryptDirHandler
+from gnukek_cli.constants import DEFAULT_JOBS
+from gnukek_cli.utils.completions import KeyIdParam
+
+
+@click.command("encrypt-dir")
+@click.argument(
+    "source_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.argument("destination_dir", type=click.Path(file_okay=False, path_type=Path))
+@click.option("-k", "--key", type=KeyIdParam(), help="key id to use")
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=CHUNK_LENGTH,
+    show_default=True,
+    help="chunk size in bytes, use 0 to disable chunk encryption",
+)
+@click.option(
+    "--version",
+    type=int,
+    default=LATEST_KEK_VERSION,
+    show_default=True,
+    help="algorithm version to use",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="number of files to encrypt in parallel",
+)
+def encrypt_dir(
+    source_dir: Path,
+    destination_dir: Path,
+    key,
+    chunk_size,
+    version,
+    jobs,
+) -> None:
+    """Encrypt all files in directory."""
+
+    context = EncryptDirContext(
+        source_dir=source_dir,
+        destination_dir=destination_dir,
+        key_id=key,
+        chunk_length=chunk_size,
+        version=version,
+        jobs=jobs,
+    )
+    handle = EncryptDirHandler(context)
+    handle()
@@ -6,3 +6,9 @@ CONFIG_DIR_PERMISSIONS = 0o700
 KEY_FILE_PERMISSIONS = 0o600
 
 DEFAULT_KEY_SIZE = 2048
+
+DEFAULT_JOBS = 1
+PIPELINE_QUEUE_DEPTH = 4
+WRITE_BATCH_LENGTH = 256 * 1024
+
+BUFFER_QUEUE_TIMEOUT_SEC = 0.1
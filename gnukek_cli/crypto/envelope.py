@@ -0,0 +1,153 @@
+"""Multi-recipient envelope format.
+
+Layout:
+    marker (1 byte, 0x00 - never a valid KEK algorithm version)
+    envelope version (1 byte)
+    flags (1 byte)
+    recipients count (2 bytes)
+    recipients: key id (8 bytes) + wrapped key length (2 bytes) + wrapped key
+    body encrypted the same way as in KEK v1
+"""
+
+import functools
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, cast
+
+from gnukek import exceptions
+from gnukek.constants import KEY_ID_LENGTH
+from gnukek.exceptions import raises
+from gnukek.keys import PublicKey
+from gnukek.utils import PreprocessedEncryptedStream
+
+from gnukek_cli.crypto import symmetric
+
+ENVELOPE_MARKER = b"\x00"
+ENVELOPE_VERSION = 1
+
+_HEADER_FORMAT = struct.Struct(">BBH")
+_RECIPIENT_FORMAT = struct.Struct(f">{KEY_ID_LENGTH}sH")
+
+
+@dataclass(frozen=True)
+class Recipient:
+    key_id: bytes
+    wrapped_key: bytes
+
+
+@dataclass
+class EnvelopeHeader:
+    recipients: list[Recipient] = field(default_factory=list)
+    flags: int = 0
+    version: int = ENVELOPE_VERSION
+
+    def serialize(self) -> bytes:
+        header = bytearray(ENVELOPE_MARKER)
+        header += _HEADER_FORMAT.pack(self.version, self.flags, len(self.recipients))
+        for recipient in self.recipients:
+            header += _RECIPIENT_FORMAT.pack(
+                recipient.key_id, len(recipient.wrapped_key)
+            )
+            header += recipient.wrapped_key
+        return bytes(header)
+
+    @classmethod
+    @raises(exceptions.DecryptionError, "Failed to read envelope header")
+    def read(cls, stream: BinaryIO) -> "EnvelopeHeader":
+        """Read header from stream positioned right after the marker."""
+        return cls._read(functools.partial(_read_exact, stream))
+
+    @classmethod
+    def _read(cls, read_exact: Callable[[int], bytes]) -> "EnvelopeHeader":
+        version, flags, recipients_count = _HEADER_FORMAT.unpack(
+            read_exact(_HEADER_FORMAT.size)
+        )
+        if version > ENVELOPE_VERSION:
+            raise exceptions.DecryptionError(
+                f"Unsupported envelope version ({version})"
+            )
+        if flags:
+            raise exceptions.DecryptionError(f"Unsupported envelope flags ({flags})")
+
+        recipients = []
+        for _ in range(recipients_count):
+            key_id, wrapped_key_length = _RECIPIENT_FORMAT.unpack(
+                read_exact(_RECIPIENT_FORMAT.size)
+            )
+            wrapped_key = read_exact(wrapped_key_length)
+            recipients.append(Recipient(key_id, wrapped_key))
+
+        return cls(recipients=recipients, flags=flags, version=version)
+
+    @property
+    def key_ids(self) -> list[bytes]:
+        return [recipient.key_id for recipient in self.recipients]
+
+    def get_recipient(self, key_id: bytes) -> Recipient:
+        for recipient in self.recipients:
+            if recipient.key_id == key_id:
+                return recipient
+        raise exceptions.DecryptionError("Data is not encrypted for this key")
+
+
+class EnvelopeEncryptor(symmetric.SymmetricEncryptor):
+    """Encrypts data once for several recipients."""
+
+    def __init__(self, public_keys: Iterable[PublicKey]) -> None:
+        super().__init__()
+        self._public_keys = list(public_keys)
+
+    def get_metadata(self) -> bytes:
+        recipients = [
+            Recipient(
+                public_key.key_id,
+                symmetric.wrap_symmetric_key(public_key, self._symmetric_key),
+            )
+            for public_key in self._public_keys
+        ]
+        return EnvelopeHeader(recipients).serialize()
+
+
+def is_envelope(data: bytes) -> bool:
+    return data[:1] == ENVELOPE_MARKER
+
+
+@raises(exceptions.DecryptionError, "Failed to read header")
+def read_encrypted_stream_header(
+    stream: BinaryIO,
+) -> PreprocessedEncryptedStream | EnvelopeHeader:
+    """Read header of either a KEK encrypted stream or an envelope."""
+    leading_byte = _read_exact(stream, 1)
+    if is_envelope(leading_byte):
+        return EnvelopeHeader.read(stream)
+
+    key_id = _read_exact(stream, KEY_ID_LENGTH)
+    return PreprocessedEncryptedStream(
+        stream, algorithm_version=leading_byte[0], key_id=key_id
+    )
+
+
+@raises(exceptions.DecryptionError, "Failed to read envelope header")
+def split_envelope(data: bytes) -> tuple[EnvelopeHeader, bytes]:
+    """Split envelope into header and body without copying the body."""
+    view = memoryview(data)
+    position = len(ENVELOPE_MARKER)
+
+    def read_exact(size: int) -> bytes:
+        nonlocal position
+        chunk = view[position : position + size]
+        if len(chunk) < size:
+            raise exceptions.DecryptionError("Unexpected end of stream")
+        position += size
+        return bytes(chunk)
+
+    header = EnvelopeHeader._read(read_exact)
+    return header, cast(bytes, view[position:])
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) < size:
+        raise exceptions.DecryptionError("Unexpected end of stream")
+    return data
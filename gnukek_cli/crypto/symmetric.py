@@ -0,0 +1,282 @@
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, cast
+
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherContext, modes
+from cryptography.hazmat.primitives.ciphers.algorithms import AES256
+from cryptography.hazmat.primitives.padding import PKCS7
+from gnukek import exceptions
+from gnukek.backends.v1 import SYMMETRIC_BLOCK_LENGTH, SYMMETRIC_KEY_LENGTH
+from gnukek.constants import ASYMMETRIC_ENCRYPTION_PADDING, CHUNK_LENGTH
+from gnukek.exceptions import raises
+from gnukek.keys import KeyPair, PublicKey
+
+from gnukek_cli.utils.buffers import read_into
+
+
+@dataclass(frozen=True)
+class SymmetricKey:
+    key: bytes
+    initialization_vector: bytes
+
+
+class SymmetricEncryptor(ABC):
+    """Base class for encryptors that own their symmetric key.
+
+    Mirrors gnukek's EncryptionBackend and adds `encrypt_into()`.
+    """
+
+    def __init__(self) -> None:
+        self._symmetric_key = generate_symmetric_key()
+
+    @abstractmethod
+    def get_metadata(self) -> bytes: ...
+
+    def encrypt(self, body: bytes) -> bytes:
+        return encrypt(self._symmetric_key, body)
+
+    def encrypt_stream(
+        self,
+        buffer: BinaryIO,
+        *,
+        chunk_length: int = CHUNK_LENGTH,
+    ) -> Iterator[bytes]:
+        return encrypt_stream(self._symmetric_key, buffer, chunk_length=chunk_length)
+
+    def encrypt_into(
+        self,
+        input_buffer: BinaryIO,
+        output_buffer: BinaryIO,
+        *,
+        chunk_length: int = CHUNK_LENGTH,
+    ) -> None:
+        encrypt_into(
+            self._symmetric_key,
+            input_buffer,
+            output_buffer,
+            chunk_length=chunk_length,
+        )
+
+
+def generate_symmetric_key() -> SymmetricKey:
+    return SymmetricKey(
+        key=os.urandom(SYMMETRIC_KEY_LENGTH),
+        initialization_vector=os.urandom(SYMMETRIC_BLOCK_LENGTH),
+    )
+
+
+def get_wrapped_key_length(key_pair: KeyPair) -> int:
+    return key_pair.key_size // 8
+
+
+@raises(exceptions.EncryptionError, "Failed to encrypt symmetric key")
+def wrap_symmetric_key(public_key: PublicKey, symmetric_key: SymmetricKey) -> bytes:
+    # gnukek does not expose raw RSA operations, so the RSA key is used directly
+    return public_key._key.encrypt(
+        symmetric_key.key + symmetric_key.initialization_vector,
+        ASYMMETRIC_ENCRYPTION_PADDING,
+    )
+
+
+@raises(exceptions.DecryptionError, "Failed to decrypt symmetric key")
+def unwrap_symmetric_key(key_pair: KeyPair, wrapped_key: bytes) -> SymmetricKey:
+    # gnukek does not expose raw RSA operations, so the RSA key is used directly
+    metadata = key_pair._rsa_private_key.decrypt(
+        wrapped_key, ASYMMETRIC_ENCRYPTION_PADDING
+    )
+    return SymmetricKey(
+        key=metadata[:SYMMETRIC_KEY_LENGTH],
+        initialization_vector=metadata[SYMMETRIC_KEY_LENGTH:],
+    )
+
+
+@raises(exceptions.EncryptionError)
+def encrypt(symmetric_key: SymmetricKey, body: bytes) -> bytes:
+    encryptor = _get_aes_cipher(
+        symmetric_key.key, symmetric_key.initialization_vector
+    ).encryptor()
+    return encryptor.update(add_padding(body)) + encryptor.finalize()
+
+
+def encrypt_stream(
+    symmetric_key: SymmetricKey,
+    buffer: BinaryIO,
+    *,
+    chunk_length: int = CHUNK_LENGTH,
+) -> Iterator[bytes]:
+    validate_chunk_length(chunk_length)
+    encryptor = _get_aes_cipher(
+        symmetric_key.key, symmetric_key.initialization_vector
+    ).encryptor()
+
+    while len(chunk := buffer.read(chunk_length)) == chunk_length:
+        yield encryptor.update(chunk)
+    yield encryptor.update(add_padding(chunk)) + encryptor.finalize()
+
+
+def encrypt_into(
+    symmetric_key: SymmetricKey,
+    input_buffer: BinaryIO,
+    output_buffer: BinaryIO,
+    *,
+    chunk_length: int = CHUNK_LENGTH,
+) -> None:
+    """Encrypt stream chunk by chunk reusing the same buffers for every chunk."""
+    validate_chunk_length(chunk_length)
+    encryptor = _get_aes_cipher(
+        symmetric_key.key, symmetric_key.initialization_vector
+    ).encryptor()
+    chunk = memoryview(bytearray(chunk_length))
+    encrypted_chunk = memoryview(bytearray(chunk_length + SYMMETRIC_BLOCK_LENGTH))
+
+    while (chunk_size := read_into(input_buffer, chunk)) == chunk_length:
+        encrypted_size = encryptor.update_into(chunk, encrypted_chunk)
+        output_buffer.write(encrypted_chunk[:encrypted_size])
+    last_chunk = add_padding(cast(bytes, chunk[:chunk_size]))
+    output_buffer.write(encryptor.update(last_chunk) + encryptor.finalize())
+
+
+@raises(exceptions.DecryptionError)
+def decrypt(symmetric_key: SymmetricKey, body: bytes) -> bytes:
+    return decrypt_chunk(
+        symmetric_key,
+        body,
+        previous_block=symmetric_key.initialization_vector,
+        is_last=True,
+    )
+
+
+def decrypt_stream(
+    symmetric_key: SymmetricKey,
+    buffer: BinaryIO,
+    *,
+    chunk_length: int = CHUNK_LENGTH,
+) -> Iterator[bytes]:
+    validate_chunk_length(chunk_length)
+    decryptor = _get_aes_cipher(
+        symmetric_key.key, symmetric_key.initialization_vector
+    ).decryptor()
+
+    next_chunk = buffer.read(chunk_length)
+    while next_chunk:
+        chunk, next_chunk = next_chunk, buffer.read(chunk_length)
+        if next_chunk:
+            yield decryptor.update(chunk)
+        else:
+            yield _decrypt_last_chunk(decryptor, chunk)
+
+
+def decrypt_into(
+    symmetric_key: SymmetricKey,
+    input_buffer: BinaryIO,
+    output_buffer: BinaryIO,
+    *,
+    chunk_length: int = CHUNK_LENGTH,
+) -> None:
+    """Decrypt stream chunk by chunk reusing the same buffers for every chunk."""
+    validate_chunk_length(chunk_length)
+    decryptor = _get_aes_cipher(
+        symmetric_key.key, symmetric_key.initialization_vector
+    ).decryptor()
+    chunk = memoryview(bytearray(chunk_length))
+    next_chunk = memoryview(bytearray(chunk_length))
+    decrypted_chunk = memoryview(bytearray(chunk_length + SYMMETRIC_BLOCK_LENGTH))
+
+    chunk_size = read_into(input_buffer, chunk)
+    while chunk_size:
+        next_chunk_size = read_into(input_buffer, next_chunk)
+        if next_chunk_size:
+            decrypted_size = decryptor.update_into(chunk, decrypted_chunk)
+            output_buffer.write(decrypted_chunk[:decrypted_size])
+        else:
+            last_chunk = cast(bytes, chunk[:chunk_size])
+            output_buffer.write(_decrypt_last_chunk(decryptor, last_chunk))
+        chunk, next_chunk = next_chunk, chunk
+        chunk_size = next_chunk_size
+
+
+@raises(exceptions.DecryptionError)
+def decrypt_chunk(
+    symmetric_key: SymmetricKey,
+    chunk: bytes,
+    *,
+    previous_block: bytes,
+    is_last: bool = False,
+) -> bytes:
+    """Decrypt a block-aligned slice of the CBC body.
+
+    `previous_block` is the ciphertext block preceding the chunk,
+    or the initialization vector for the first chunk.
+    """
+    decryptor = _get_aes_cipher(symmetric_key.key, previous_block).decryptor()
+    if not is_last:
+        return decryptor.update(chunk)
+    return _decrypt_last_chunk(decryptor, chunk)
+
+
+def decrypt_stream_parallel(
+    symmetric_key: SymmetricKey,
+    buffer: BinaryIO,
+    *,
+    chunk_length: int = CHUNK_LENGTH,
+    jobs: int,
+) -> Iterator[bytes]:
+    """Decrypt the CBC body using a pool of workers.
+
+    Chunks are decrypted independently and yielded in their original order.
+    At most `jobs` chunks are processed at once.
+    """
+    validate_chunk_length(chunk_length)
+
+    with ThreadPoolExecutor(jobs) as executor:
+        pending_chunks: deque[Future[bytes]] = deque()
+        previous_block = symmetric_key.initialization_vector
+        next_chunk = buffer.read(chunk_length)
+
+        while next_chunk:
+            chunk, next_chunk = next_chunk, buffer.read(chunk_length)
+            pending_chunks.append(
+                executor.submit(
+                    decrypt_chunk,
+                    symmetric_key,
+                    chunk,
+                    previous_block=previous_block,
+                    is_last=not next_chunk,
+                )
+            )
+            previous_block = chunk[-SYMMETRIC_BLOCK_LENGTH:]
+
+            if len(pending_chunks) >= jobs:
+                yield pending_chunks.popleft().result()
+
+        while pending_chunks:
+            yield pending_chunks.popleft().result()
+
+
+def validate_chunk_length(chunk_length: int) -> None:
+    if chunk_length <= 0 or chunk_length % SYMMETRIC_BLOCK_LENGTH:
+        raise exceptions.KekException("Chunk length is not multiple of block length")
+
+
+def add_padding(block: bytes) -> bytes:
+    padder = PKCS7(SYMMETRIC_BLOCK_LENGTH * 8).padder()
+    return padder.update(block) + padder.finalize()
+
+
+@raises(exceptions.DecryptionError)
+def remove_padding(block: bytes) -> bytes:
+    unpadder = PKCS7(SYMMETRIC_BLOCK_LENGTH * 8).unpadder()
+    return unpadder.update(block) + unpadder.finalize()
+
+
+@raises(exceptions.DecryptionError)
+def _decrypt_last_chunk(decryptor: CipherContext, chunk: bytes) -> bytes:
+    return remove_padding(decryptor.update(chunk) + decryptor.finalize())
+
+
+def _get_aes_cipher(symmetric_key: bytes, initialization_vector: bytes) -> Cipher:
+    return Cipher(AES256(symmetric_key), modes.CBC(initialization_vector))
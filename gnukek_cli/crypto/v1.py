@@ -0,0 +1,19 @@
+from gnukek.keys import PublicKey
+
+from gnukek_cli.crypto import symmetric
+
+
+class V1Encryptor(symmetric.SymmetricEncryptor):
+    """Produces the same output as gnukek's v1 encryptor."""
+
+    version = 1
+
+    def __init__(self, public_key: PublicKey) -> None:
+        super().__init__()
+        self._public_key = public_key
+
+    def get_metadata(self) -> bytes:
+        header = self.version.to_bytes(1, "big") + self._public_key.key_id
+        return header + symmetric.wrap_symmetric_key(
+            self._public_key, self._symmetric_key
+        )
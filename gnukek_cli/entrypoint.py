@@ -18,9 +18,11 @@ except ImportError:
 @click.group(
     commands=[
         commands.decrypt,
+        commands.decrypt_dir,
         commands.delete_key,
         commands.edit,
         commands.encrypt,
+        commands.encrypt_dir,
         commands.export,
         commands.generate,
         commands.import_keys,
@@ -1,82 +1,14 @@
-import os
 import sys
 import threading
 from collections import deque
 from collections.abc import Iterator
 from functools import reduce
-from types import TracebackType
-from typing import BinaryIO
 
 from gnukek_cli.extras.s3.constants import (
     DOWNLOAD_BUFFER_TIMEOUT_SEC,
     DOWNLOAD_MEMORY_LIMIT_BYTES,
 )
-
-
-class CustomBuffer(BinaryIO):
-    """Base class for custom encryption/decryption buffers."""
-
-    def __enter__(self) -> BinaryIO:
-        return self
-
-    def read(self, size: int = -1) -> bytes:
-        raise NotImplementedError("read() is not supported")
-
-    def write(self, chunk: bytes) -> int:  # type: ignore
-        raise NotImplementedError("write() is not supported")
-
-    def __exit__(
-        self,
-        type: type[BaseException] | None,
-        value: BaseException | None,
-        traceback: TracebackType | None,
-    ) -> None:
-        pass
-
-    def readable(self) -> bool:
-        return True
-
-    def writable(self) -> bool:
-        return True
-
-    def seekable(self) -> bool:
-        return False
-
-    def close(self) -> None:
-        pass
-
-    def flush(self) -> None:
-        pass
-
-    def isatty(self) -> bool:
-        return False
-
-    def tell(self) -> int:
-        raise NotImplementedError("tell() is not supported")
-
-    def truncate(self, size: int | None = None) -> int:
-        raise NotImplementedError("truncate() is not supported")
-
-    def fileno(self) -> int:
-        raise NotImplementedError("fileno() is not supported")
-
-    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
-        raise NotImplementedError("seek() is not supported")
-
-    def readline(self, size: int = -1) -> bytes:
-        raise NotImplementedError("readline() is not supported")
-
-    def readlines(self, hint: int = -1) -> list[bytes]:
-        raise NotImplementedError("readlines() is not supported")
-
-    def writelines(self, lines: list[bytes]) -> None:  # type: ignore
-        raise NotImplementedError("writelines() is not supported")
-
-    def __iter__(self) -> Iterator[bytes]:
-        raise NotImplementedError("__iter__() is not supported")
-
-    def __next__(self) -> bytes:
-        raise NotImplementedError("__next__() is not supported")
+from gnukek_cli.utils.buffers import CustomBuffer
 
 
 class LazyEncryptionBuffer(CustomBuffer):
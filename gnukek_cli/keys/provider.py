@@ -1,5 +1,6 @@
 import logging
 import random
+import threading
 
 from gnukek.keys import KeyPair, PublicKey
 
@@ -25,31 +26,38 @@ class KeyProvider:
         self._password_prompt = password_prompt
         self._public_key_cache: dict[str, PublicKey] = {}
         self._key_pair_cache: dict[str, KeyPair] = {}
+        self._lock = threading.RLock()
 
     def get_public_key(self, key_id: str | None = None) -> PublicKey:
         key_id = self._get_key_id(key_id)
-        if key_id in self._public_key_cache:
-            logger.debug(f"Public key for {key_id} retrieved from cache")
-            return self._public_key_cache[key_id]
-        if key_id in self._key_pair_cache:
-            logger.debug(f"Public key for {key_id} retrieved from key pair cache")
-            return self._key_pair_cache[key_id].public_key
-
-        public_key = self._read_public_key(key_id)
-        self._public_key_cache[key_id] = public_key
-        logger.debug(f"Public key for {key_id} read from storage")
-        return public_key
+        with self._lock:
+            if key_id in self._public_key_cache:
+                logger.debug(f"Public key for {key_id} retrieved from cache")
+                return self._public_key_cache[key_id]
+            if key_id in self._key_pair_cache:
+                logger.debug(f"Public key for {key_id} retrieved from key pair cache")
+                return self._key_pair_cache[key_id].public_key
+
+            public_key = self._read_public_key(key_id)
+            self._public_key_cache[key_id] = public_key
+            logger.debug(f"Public key for {key_id} read from storage")
+            return public_key
 
     def get_key_pair(self, key_id: str | None = None) -> KeyPair:
         key_id = self._get_key_id(key_id)
-        if key_id in self._key_pair_cache:
-            logger.debug(f"Key pair for {key_id} retrieved from cache")
-            return self._key_pair_cache[key_id]
+        with self._lock:
+            if key_id in self._key_pair_cache:
+                logger.debug(f"Key pair for {key_id} retrieved from cache")
+                return self._key_pair_cache[key_id]
 
-        key_pair = self._read_key_pair(key_id)
-        self._key_pair_cache[key_id] = key_pair
-        logger.debug(f"Key pair for {key_id} read from storage")
-        return key_pair
+            key_pair = self._read_key_pair(key_id)
+            self._key_pair_cache[key_id] = key_pair
+            logger.debug(f"Key pair for {key_id} read from storage")
+            return key_pair
+
+    def has_key_pair(self, key_id: str) -> bool:
+        settings = self.settings_provider.get_settings()
+        return key_id in settings.private
 
     def add_public_key(self, public_key: PublicKey) -> None:
         settings = self.settings_provider.get_settings()
@@ -0,0 +1,386 @@
+import io
+import mmap
+import os
+import queue
+import stat
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext, suppress
+from types import TracebackType
+from typing import BinaryIO, ContextManager, cast
+
+from gnukek_cli.constants import BUFFER_QUEUE_TIMEOUT_SEC
+
+
+class CustomBuffer(BinaryIO):
+    """Base class for custom encryption/decryption buffers."""
+
+    def __enter__(self) -> BinaryIO:
+        return self
+
+    def read(self, size: int = -1) -> bytes:
+        raise NotImplementedError("read() is not supported")
+
+    def write(self, chunk: bytes) -> int:  # type: ignore
+        raise NotImplementedError("write() is not supported")
+
+    def __exit__(
+        self,
+        type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise NotImplementedError("tell() is not supported")
+
+    def truncate(self, size: int | None = None) -> int:
+        raise NotImplementedError("truncate() is not supported")
+
+    def fileno(self) -> int:
+        raise NotImplementedError("fileno() is not supported")
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        raise NotImplementedError("seek() is not supported")
+
+    def readline(self, size: int = -1) -> bytes:
+        raise NotImplementedError("readline() is not supported")
+
+    def readlines(self, hint: int = -1) -> list[bytes]:
+        raise NotImplementedError("readlines() is not supported")
+
+    def writelines(self, lines: list[bytes]) -> None:  # type: ignore
+        raise NotImplementedError("writelines() is not supported")
+
+    def __iter__(self) -> Iterator[bytes]:
+        raise NotImplementedError("__iter__() is not supported")
+
+    def __next__(self) -> bytes:
+        raise NotImplementedError("__next__() is not supported")
+
+
+class BufferPool:
+    """Bounded pool of reusable buffers.
+
+    Buffers are allocated lazily, at most `count` of them. `acquire()` blocks
+    while all of them are in use, which throttles the producer.
+    """
+
+    def __init__(self, buffer_length: int, count: int) -> None:
+        if count < 1:
+            raise ValueError("Buffer pool size must be positive")
+
+        self.buffer_length = buffer_length
+        self.count = count
+        self.allocated_count = 0
+        self._buffers: queue.LifoQueue[bytearray] = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> bytearray:
+        """Return a free buffer, raises `queue.Empty` on timeout."""
+        with self._lock:
+            if self._buffers.empty() and self.allocated_count < self.count:
+                self.allocated_count += 1
+                return bytearray(self.buffer_length)
+        return self._buffers.get(timeout=timeout)
+
+    def release(self, buffer: bytearray) -> None:
+        self._buffers.put(buffer)
+
+
+class ReadAheadBuffer(CustomBuffer):
+    """Buffer that reads chunks from the wrapped stream in a background thread.
+
+    Chunks are read into a pool of `depth + 1` reused buffers, so at most
+    `depth` chunks wait to be consumed at once.
+    """
+
+    def __init__(self, buffer: BinaryIO, *, chunk_length: int, depth: int) -> None:
+        if depth < 1:
+            raise ValueError("Read-ahead depth must be positive")
+
+        self._buffer = buffer
+        self._pool = BufferPool(chunk_length, depth + 1)
+        self._chunks: queue.SimpleQueue[tuple[bytearray, int] | BaseException] = (
+            queue.SimpleQueue()
+        )
+        self._chunk: bytearray | None = None
+        self._chunk_end = 0
+        self._position = 0
+        self._finished = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._read_chunks, daemon=True)
+
+    def __enter__(self) -> "ReadAheadBuffer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def read(self, size: int = -1) -> bytes:
+        remaining_size = size if size >= 0 else sys.maxsize
+        parts = []
+
+        while remaining_size and (view := self._get_current_view()):
+            part = bytes(view[:remaining_size])
+            self._position += len(part)
+            remaining_size -= len(part)
+            parts.append(part)
+
+        return b"".join(parts)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        target = memoryview(buffer).cast("B")
+        filled_size = 0
+
+        while filled_size < len(target) and (view := self._get_current_view()):
+            part_size = min(len(view), len(target) - filled_size)
+            target[filled_size : filled_size + part_size] = view[:part_size]
+            self._position += part_size
+            filled_size += part_size
+
+        return filled_size
+
+    def _get_current_view(self) -> memoryview:
+        if self._position == self._chunk_end:
+            self._next_chunk()
+        if self._chunk is None:
+            return memoryview(b"")
+        return memoryview(self._chunk)[self._position : self._chunk_end]
+
+    def _next_chunk(self) -> None:
+        if self._chunk is not None:
+            self._pool.release(self._chunk)
+            self._chunk = None
+        if self._finished:
+            return
+
+        item = self._chunks.get()
+        if isinstance(item, BaseException):
+            self._finished = True
+            raise item
+
+        chunk, chunk_length = item
+        if not chunk_length:
+            self._pool.release(chunk)
+            self._finished = True
+            return
+
+        self._chunk, self._chunk_end, self._position = chunk, chunk_length, 0
+
+    def _read_chunks(self) -> None:
+        try:
+            while (chunk := self._acquire()) is not None:
+                chunk_length = read_into(self._buffer, memoryview(chunk))
+                self._chunks.put((chunk, chunk_length))
+                if chunk_length < len(chunk):
+                    return
+        except BaseException as exc:
+            self._chunks.put(exc)
+
+    def _acquire(self) -> bytearray | None:
+        while not self._stopped.is_set():
+            try:
+                return self._pool.acquire(timeout=BUFFER_QUEUE_TIMEOUT_SEC)
+            except queue.Empty:
+                continue
+        return None
+
+
+class WriteBehindBuffer(CustomBuffer):
+    """Buffer that writes data to the wrapped stream in a background thread.
+
+    Written data is copied into a pool of `depth + 1` batches of `batch_length`
+    bytes, so small writes are coalesced and callers may reuse their buffers
+    as soon as `write()` returns.
+    """
+
+    def __init__(self, buffer: BinaryIO, *, depth: int, batch_length: int) -> None:
+        if depth < 1:
+            raise ValueError("Write-behind depth must be positive")
+
+        self._buffer = buffer
+        self._pool = BufferPool(batch_length, depth + 1)
+        self._batches: queue.SimpleQueue[tuple[bytearray, int] | None] = (
+            queue.SimpleQueue()
+        )
+        self._batch: bytearray | None = None
+        self._batch_position = 0
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._write_batches, daemon=True)
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if not value:
+            self._submit_batch()
+        self._batches.put(None)
+        self._thread.join()
+        if self._error and not value:
+            raise self._error
+
+    def write(self, chunk: bytes) -> int:  # type: ignore
+        if self._error:
+            raise self._error
+
+        data = memoryview(chunk).cast("B")
+        while data:
+            if self._batch is None:
+                self._batch = self._acquire()
+
+            part_size = min(len(data), len(self._batch) - self._batch_position)
+            self._batch[self._batch_position : self._batch_position + part_size] = data[
+                :part_size
+            ]
+            self._batch_position += part_size
+            data = data[part_size:]
+
+            if self._batch_position == len(self._batch):
+                self._submit_batch()
+        return len(chunk)
+
+    def _acquire(self) -> bytearray:
+        while True:
+            if self._error:
+                raise self._error
+            try:
+                return self._pool.acquire(timeout=BUFFER_QUEUE_TIMEOUT_SEC)
+            except queue.Empty:
+                continue
+
+    def _submit_batch(self) -> None:
+        if self._batch is None:
+            return
+        self._batches.put((self._batch, self._batch_position))
+        self._batch, self._batch_position = None, 0
+
+    def _write_batches(self) -> None:
+        while (item := self._batches.get()) is not None:
+            batch, batch_length = item
+            try:
+                if not self._error:
+                    self._buffer.write(memoryview(batch)[:batch_length])
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                self._pool.release(batch)
+
+
+def read_into(stream: BinaryIO, buffer: memoryview) -> int:
+    """Fill the buffer from stream.
+
+    Returns the number of bytes read, which is less than the buffer length
+    only at the end of the stream.
+    """
+    readinto = getattr(stream, "readinto", None)
+    filled_size = 0
+
+    while filled_size < len(buffer):
+        if readinto:
+            part_size = readinto(buffer[filled_size:]) or 0
+        else:
+            part = stream.read(len(buffer) - filled_size)
+            part_size = len(part)
+            buffer[filled_size : filled_size + part_size] = part
+        if not part_size:
+            break
+        filled_size += part_size
+
+    return filled_size
+
+
+def iter_chunks(stream: BinaryIO, *, chunk_length: int) -> Iterator[bytes]:
+    """Iterate over stream chunks read into a single reused buffer.
+
+    Every chunk is only valid until the next one is requested.
+    """
+    buffer = memoryview(bytearray(chunk_length))
+    while size := read_into(stream, buffer):
+        yield cast(bytes, buffer[:size])
+        if size < chunk_length:
+            return
+
+
+def read_ahead(
+    buffer: BinaryIO, *, chunk_length: int, depth: int
+) -> ContextManager[BinaryIO]:
+    """Wrap stream into a read-ahead buffer unless `depth` is zero."""
+    if not depth:
+        return nullcontext(buffer)
+    return ReadAheadBuffer(buffer, chunk_length=chunk_length, depth=depth)
+
+
+def write_behind(
+    buffer: BinaryIO, *, depth: int, batch_length: int
+) -> ContextManager[BinaryIO]:
+    """Wrap stream into a write-behind buffer unless `depth` is zero."""
+    if not depth:
+        return nullcontext(buffer)
+    return WriteBehindBuffer(buffer, depth=depth, batch_length=batch_length)
+
+
+@contextmanager
+def map_file(file: BinaryIO) -> Iterator[bytes]:
+    """Expose the rest of the file as a buffer.
+
+    Regular files are memory-mapped, so their content is served by the page
+    cache instead of being copied into memory. Other streams are read whole.
+    """
+    try:
+        fileno = file.fileno()
+        file_stat = os.fstat(fileno)
+    except (AttributeError, OSError, io.UnsupportedOperation, NotImplementedError):
+        file_stat = None
+
+    if not file_stat or not stat.S_ISREG(file_stat.st_mode) or not file_stat.st_size:
+        yield file.read()
+        return
+
+    mapped_file = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    try:
+        with memoryview(mapped_file) as view:
+            content = view[file.tell() :]
+            try:
+                # gnukek and cryptography accept any buffer, not just bytes
+                yield cast(bytes, content)
+            finally:
+                content.release()
+    finally:
+        with suppress(BufferError):
+            # Views leaked by a failed operation keep the mapping alive until
+            # they are garbage collected
+            mapped_file.close()
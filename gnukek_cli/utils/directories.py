@@ -0,0 +1,70 @@
+import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import BinaryIO, Callable
+
+logger = logging.getLogger(__name__)
+
+FileProcessor = Callable[[BinaryIO, BinaryIO], None]
+
+
+def iter_files(root: Path) -> Iterator[Path]:
+    """Yield paths of regular files under `root` relative to it."""
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path).relative_to(root)
+
+
+def process_file(
+    relative_path: Path,
+    source_dir: Path,
+    destination_dir: Path,
+    process: FileProcessor,
+) -> None:
+    source_path = source_dir / relative_path
+    destination_path = destination_dir / relative_path
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+
+    time_start = perf_counter()
+    with open(source_path, "rb") as input_file, open(
+        destination_path, "wb"
+    ) as output_file:
+        process(input_file, output_file)
+    time_elapsed = perf_counter() - time_start
+
+    size_mb = source_path.stat().st_size / (1024 * 1024)
+    throughput = size_mb / time_elapsed if time_elapsed else 0
+    logger.info(
+        f"{relative_path}: {size_mb:.2f} MB in {time_elapsed:.4f} seconds "
+        f"({throughput:.2f} MB/s)"
+    )
+
+
+def process_directory(
+    source_dir: Path,
+    destination_dir: Path,
+    process: FileProcessor,
+    *,
+    jobs: int,
+) -> int:
+    """Process every file in `source_dir` mirroring the tree in `destination_dir`.
+
+    Returns the number of processed files.
+    """
+    with ThreadPoolExecutor(jobs) as executor:
+        results = executor.map(
+            lambda relative_path: process_file(
+                relative_path, source_dir, destination_dir, process
+            ),
+            iter_files(source_dir),
+        )
+        return sum(1 for _ in results)
@@ -129,3 +129,8 @@ def password_prompt_mock():
 @pytest.fixture()
 def output_buffer():
     return io.BytesIO()
+
+
+@pytest.fixture(scope="session")
+def other_key_pair():
+    return KeyPair.generate(2048)
@@ -0,0 +1,81 @@
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+
+from gnukek_cli.utils.buffers import ReadAheadBuffer, WriteBehindBuffer, map_file
+from tests.constants import SAMPLE_MESSAGE
+
+
+@pytest.mark.parametrize("read_size", [1, 16, 32, 100, len(SAMPLE_MESSAGE) + 1])
+def test_read_ahead_buffer(read_size):
+    with ReadAheadBuffer(BytesIO(SAMPLE_MESSAGE), chunk_length=32, depth=2) as buffer:
+        chunks = []
+        while chunk := buffer.read(read_size):
+            chunks.append(chunk)
+
+    assert b"".join(chunks) == SAMPLE_MESSAGE
+    assert all(len(chunk) == read_size for chunk in chunks[:-1])
+
+
+def test_read_ahead_buffer_read_all():
+    with ReadAheadBuffer(BytesIO(SAMPLE_MESSAGE), chunk_length=32, depth=2) as buffer:
+        assert buffer.read() == SAMPLE_MESSAGE
+        assert buffer.read() == b""
+
+
+def test_read_ahead_buffer_error():
+    stream_mock = MagicMock()
+    stream_mock.read.side_effect = OSError("read failed")
+
+    with ReadAheadBuffer(stream_mock, chunk_length=32, depth=2) as buffer:
+        with pytest.raises(OSError):
+            buffer.read(32)
+
+
+def test_read_ahead_buffer_early_exit():
+    with ReadAheadBuffer(BytesIO(SAMPLE_MESSAGE), chunk_length=1, depth=1) as buffer:
+        assert buffer.read(1) == SAMPLE_MESSAGE[:1]
+
+
+def test_write_behind_buffer():
+    output_buffer = BytesIO()
+    with WriteBehindBuffer(output_buffer, depth=2) as buffer:
+        for i in range(0, len(SAMPLE_MESSAGE), 10):
+            buffer.write(SAMPLE_MESSAGE[i : i + 10])
+
+    assert output_buffer.getvalue() == SAMPLE_MESSAGE
+
+
+def test_write_behind_buffer_error():
+    stream_mock = MagicMock()
+    stream_mock.write.side_effect = OSError("write failed")
+
+    with pytest.raises(OSError):
+        with WriteBehindBuffer(stream_mock, depth=1) as buffer:
+            buffer.write(SAMPLE_MESSAGE)
+
+
+def test_map_file(tmp_path):
+    file_path = tmp_path / "file"
+    file_path.write_bytes(SAMPLE_MESSAGE)
+
+    with open(file_path, "rb") as file:
+        file.read(10)
+        with map_file(file) as content:
+            assert isinstance(content, memoryview)
+            assert content == SAMPLE_MESSAGE[10:]
+
+
+def test_map_empty_file(tmp_path):
+    file_path = tmp_path / "file"
+    file_path.touch()
+
+    with open(file_path, "rb") as file:
+        with map_file(file) as content:
+            assert content == b""
+
+
+def test_map_stream():
+    with map_file(BytesIO(SAMPLE_MESSAGE)) as content:
+        assert content == SAMPLE_MESSAGE
@@ -2,8 +2,10 @@ import functools
 from io import BytesIO
 
 import pytest
+from gnukek.exceptions import KekException
 
 from gnukek_cli.command_handlers.decrypt import DecryptContext, DecryptHandler
+from gnukek_cli.crypto.envelope import EnvelopeEncryptor
 from gnukek_cli.utils.exceptions import KeyNotFoundError
 from tests.constants import KEY_ENCRYPTION_PASSWORD, SAMPLE_MESSAGE
 
@@ -15,7 +17,10 @@ def create_handler(key_provider):
 
 @pytest.mark.usefixtures("saved_encrypted_private_key", "settings_file")
 @pytest.mark.parametrize("chunk_length", [0, 32, 1024])
-def test_decrypt(chunk_length, create_handler, password_prompt_mock, encrypted_message):
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_decrypt(
+    chunk_length, pipeline, create_handler, password_prompt_mock, encrypted_message
+):
     password_prompt_mock.get_password.return_value = KEY_ENCRYPTION_PASSWORD
 
     output_buffer = BytesIO()
@@ -24,6 +29,7 @@ def test_decrypt(chunk_length, create_handler, password_prompt_mock, encrypted_m
             input_file=BytesIO(encrypted_message),  # type: ignore
             output_file=output_buffer,
             chunk_length=chunk_length,
+            pipeline=pipeline,
         )
     )
     handle()
@@ -43,3 +49,98 @@ def test_decrypt_no_key_found(create_handler, encrypted_message):
     )
     with pytest.raises(KeyNotFoundError):
         handle()
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+@pytest.mark.parametrize("chunk_length", [16, 32, 1024])
+@pytest.mark.parametrize("jobs", [2, 4])
+def test_decrypt_parallel(chunk_length, jobs, create_handler, encrypted_message):
+    output_buffer = BytesIO()
+    handle = create_handler(
+        DecryptContext(
+            input_file=BytesIO(encrypted_message),  # type: ignore
+            output_file=output_buffer,
+            chunk_length=chunk_length,
+            jobs=jobs,
+        )
+    )
+    handle()
+
+    assert output_buffer.getvalue() == SAMPLE_MESSAGE
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+def test_decrypt_parallel_invalid_chunk_length(create_handler, encrypted_message):
+    handle = create_handler(
+        DecryptContext(
+            input_file=BytesIO(encrypted_message),  # type: ignore
+            output_file=BytesIO(),
+            chunk_length=10,
+            jobs=2,
+        )
+    )
+    with pytest.raises(KekException):
+        handle()
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+@pytest.mark.parametrize("chunk_length", [0, 32])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_decrypt_envelope(
+    chunk_length, jobs, create_handler, sample_public_key, other_key_pair
+):
+    encryptor = EnvelopeEncryptor([other_key_pair.public_key, sample_public_key])
+    encrypted_message = encryptor.get_metadata() + encryptor.encrypt(SAMPLE_MESSAGE)
+
+    output_buffer = BytesIO()
+    handle = create_handler(
+        DecryptContext(
+            input_file=BytesIO(encrypted_message),  # type: ignore
+            output_file=output_buffer,
+            chunk_length=chunk_length,
+            jobs=jobs,
+        )
+    )
+    handle()
+
+    assert output_buffer.getvalue() == SAMPLE_MESSAGE
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+def test_decrypt_envelope_no_key_found(create_handler, other_key_pair):
+    encryptor = EnvelopeEncryptor([other_key_pair.public_key])
+    encrypted_message = encryptor.get_metadata() + encryptor.encrypt(SAMPLE_MESSAGE)
+
+    handle = create_handler(
+        DecryptContext(
+            input_file=BytesIO(encrypted_message),  # type: ignore
+            output_file=BytesIO(),
+        )
+    )
+    with pytest.raises(KeyNotFoundError):
+        handle()
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+@pytest.mark.parametrize("envelope", [False, True])
+def test_decrypt_mapped_file(
+    envelope, create_handler, tmp_path, encrypted_message, sample_public_key
+):
+    if envelope:
+        encryptor = EnvelopeEncryptor([sample_public_key])
+        encrypted_message = encryptor.get_metadata() + encryptor.encrypt(SAMPLE_MESSAGE)
+    encrypted_file_path = tmp_path / "encrypted"
+    encrypted_file_path.write_bytes(encrypted_message)
+
+    output_buffer = BytesIO()
+    with open(encrypted_file_path, "rb") as encrypted_file:
+        handle = create_handler(
+            DecryptContext(
+                input_file=encrypted_file,
+                output_file=output_buffer,
+                chunk_length=0,
+            )
+        )
+        handle()
+
+    assert output_buffer.getvalue() == SAMPLE_MESSAGE
@@ -0,0 +1,40 @@
+import functools
+
+import pytest
+
+from gnukek_cli.command_handlers.decrypt_dir import DecryptDirContext, DecryptDirHandler
+from tests.constants import KEY_ENCRYPTION_PASSWORD, SAMPLE_MESSAGE
+
+
+@pytest.fixture()
+def create_handler(key_provider):
+    return functools.partial(DecryptDirHandler, key_provider=key_provider)
+
+
+@pytest.fixture()
+def encrypted_dir(tmp_path, encrypted_message):
+    source_dir = tmp_path / "source"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / "a.kek").write_bytes(encrypted_message)
+    (source_dir / "nested" / "b.kek").write_bytes(encrypted_message)
+    return source_dir
+
+
+@pytest.mark.usefixtures("saved_encrypted_private_key", "settings_file")
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_decrypt_dir(
+    jobs, create_handler, encrypted_dir, tmp_path, password_prompt_mock
+):
+    password_prompt_mock.get_password.return_value = KEY_ENCRYPTION_PASSWORD
+    destination_dir = tmp_path / "destination"
+
+    handle = create_handler(
+        DecryptDirContext(
+            source_dir=encrypted_dir, destination_dir=destination_dir, jobs=jobs
+        )
+    )
+    handle()
+
+    assert (destination_dir / "a.kek").read_bytes() == SAMPLE_MESSAGE
+    assert (destination_dir / "nested" / "b.kek").read_bytes() == SAMPLE_MESSAGE
+    password_prompt_mock.get_password.assert_called_once()
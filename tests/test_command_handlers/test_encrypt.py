@@ -6,6 +6,8 @@ from unittest.mock import MagicMock
 import pytest
 
 from gnukek_cli.command_handlers.encrypt import EncryptContext, EncryptHandler
+from gnukek_cli.crypto.envelope import EnvelopeHeader, read_encrypted_stream_header
+from gnukek_cli.crypto.symmetric import decrypt, unwrap_symmetric_key
 from gnukek_cli.utils.exceptions import KeyNotFoundError
 from tests.constants import KEY_ENCRYPTION_PASSWORD, KEY_ID, SAMPLE_MESSAGE
 from tests.helpers import remove_public_keys_from_settings
@@ -17,10 +19,15 @@ def create_handler(key_provider):
 
 
 @pytest.mark.usefixtures("saved_public_key", "settings_file")
-def test_encrypt_using_default_public_key(create_handler, sample_key_pair):
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_encrypt_using_default_public_key(pipeline, create_handler, sample_key_pair):
     output_buffer = BytesIO()
     handle = create_handler(
-        EncryptContext(input_file=BytesIO(SAMPLE_MESSAGE), output_file=output_buffer)
+        EncryptContext(
+            input_file=BytesIO(SAMPLE_MESSAGE),
+            output_file=output_buffer,
+            pipeline=pipeline,
+        )
     )
     handle()
 
@@ -78,3 +85,69 @@ def test_encrypt_no_key_id(create_handler):
     )
     with pytest.raises(KeyNotFoundError):
         handle()
+
+
+@pytest.mark.usefixtures("saved_public_key", "settings_file")
+@pytest.mark.parametrize("jobs", [2, 8])
+def test_encrypt_read_ahead(jobs, create_handler, sample_key_pair):
+    output_buffer = BytesIO()
+    handle = create_handler(
+        EncryptContext(
+            input_file=BytesIO(SAMPLE_MESSAGE),
+            output_file=output_buffer,
+            chunk_length=32,
+            jobs=jobs,
+        )
+    )
+    handle()
+
+    decrypted_message = sample_key_pair.decrypt(output_buffer.getvalue())
+    assert decrypted_message == SAMPLE_MESSAGE
+
+
+@pytest.mark.usefixtures("saved_public_key", "settings_file")
+@pytest.mark.parametrize("chunk_length", [0, 32])
+def test_encrypt_multiple_recipients(
+    chunk_length, create_handler, key_provider, sample_key_pair, other_key_pair
+):
+    key_provider.add_public_key(other_key_pair.public_key)
+    output_buffer = BytesIO()
+
+    handle = create_handler(
+        EncryptContext(
+            input_file=BytesIO(SAMPLE_MESSAGE),
+            output_file=output_buffer,
+            key_id=KEY_ID,
+            chunk_length=chunk_length,
+            additional_key_ids=[other_key_pair.key_id.hex(), KEY_ID],
+        )
+    )
+    handle()
+
+    encrypted_stream = BytesIO(output_buffer.getvalue())
+    header = read_encrypted_stream_header(encrypted_stream)
+    assert isinstance(header, EnvelopeHeader)
+    assert header.key_ids == [sample_key_pair.key_id, other_key_pair.key_id]
+
+    body = encrypted_stream.read()
+    for key_pair in (sample_key_pair, other_key_pair):
+        recipient = header.get_recipient(key_pair.key_id)
+        symmetric_key = unwrap_symmetric_key(key_pair, recipient.wrapped_key)
+        assert decrypt(symmetric_key, body) == SAMPLE_MESSAGE
+
+
+@pytest.mark.usefixtures("saved_public_key", "settings_file")
+def test_encrypt_mapped_file(create_handler, tmp_path, sample_key_pair):
+    input_file_path = tmp_path / "input"
+    input_file_path.write_bytes(SAMPLE_MESSAGE)
+
+    output_buffer = BytesIO()
+    with open(input_file_path, "rb") as input_file:
+        handle = create_handler(
+            EncryptContext(
+                input_file=input_file, output_file=output_buffer, chunk_length=0
+            )
+        )
+        handle()
+
+    assert sample_key_pair.decrypt(output_buffer.getvalue()) == SAMPLE_MESSAGE
@@ -0,0 +1,59 @@
+import functools
+
+import pytest
+
+from gnukek_cli.command_handlers.encrypt_dir import EncryptDirContext, EncryptDirHandler
+from gnukek_cli.utils.exceptions import KeyNotFoundError
+from tests.constants import SAMPLE_MESSAGE
+
+SOURCE_FILES = {
+    "a.txt": SAMPLE_MESSAGE,
+    "empty.txt": b"",
+    "nested/b.txt": SAMPLE_MESSAGE * 3,
+    "nested/deeper/c.txt": b"c",
+}
+
+
+@pytest.fixture()
+def create_handler(key_provider):
+    return functools.partial(EncryptDirHandler, key_provider=key_provider)
+
+
+@pytest.fixture()
+def source_dir(tmp_path):
+    source_dir = tmp_path / "source"
+    for name, content in SOURCE_FILES.items():
+        path = source_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return source_dir
+
+
+@pytest.mark.usefixtures("saved_public_key", "settings_file")
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_encrypt_dir(jobs, create_handler, source_dir, tmp_path, sample_key_pair):
+    destination_dir = tmp_path / "destination"
+
+    handle = create_handler(
+        EncryptDirContext(
+            source_dir=source_dir,
+            destination_dir=destination_dir,
+            chunk_length=32,
+            jobs=jobs,
+        )
+    )
+    handle()
+
+    for name, content in SOURCE_FILES.items():
+        encrypted_content = (destination_dir / name).read_bytes()
+        assert sample_key_pair.decrypt(encrypted_content) == content
+
+
+def test_encrypt_dir_no_key(create_handler, source_dir, tmp_path):
+    handle = create_handler(
+        EncryptDirContext(
+            source_dir=source_dir, destination_dir=tmp_path / "destination"
+        )
+    )
+    with pytest.raises(KeyNotFoundError):
+        handle()
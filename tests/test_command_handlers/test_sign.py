@@ -15,11 +15,15 @@ def create_handler(key_provider):
 
 @pytest.mark.usefixtures("saved_private_key", "settings_file")
 @pytest.mark.parametrize("key_id", [None, KEY_ID])
-def test_sign(key_id, create_handler, sample_public_key):
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_sign(key_id, pipeline, create_handler, sample_public_key):
     output_buffer = BytesIO()
     handle = create_handler(
         SignContext(
-            input_file=BytesIO(SAMPLE_MESSAGE), output_file=output_buffer, key_id=key_id
+            input_file=BytesIO(SAMPLE_MESSAGE),
+            output_file=output_buffer,
+            key_id=key_id,
+            pipeline=pipeline,
         )
     )
     handle()
@@ -34,3 +38,21 @@ def test_sign_no_key_found(create_handler):
     )
     with pytest.raises(KeyNotFoundError):
         handle()
+
+
+@pytest.mark.usefixtures("saved_private_key", "settings_file")
+def test_sign_mapped_file(create_handler, tmp_path, sample_public_key):
+    input_file_path = tmp_path / "input"
+    input_file_path.write_bytes(SAMPLE_MESSAGE)
+
+    output_buffer = BytesIO()
+    with open(input_file_path, "rb") as input_file:
+        handle = create_handler(
+            SignContext(
+                input_file=input_file, output_file=output_buffer, chunk_length=0
+            )
+        )
+        handle()
+
+    signature = output_buffer.getvalue()
+    assert sample_public_key.verify(signature, message=SAMPLE_MESSAGE)
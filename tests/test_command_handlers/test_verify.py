@@ -75,3 +75,20 @@ def test_verify_no_key_id(create_handler, message_signature):
     )
     with pytest.raises(KeyNotFoundError):
         handle()
+
+
+@pytest.mark.usefixtures("saved_public_key", "settings_file")
+def test_verify_mapped_file(create_handler, message_signature, tmp_path):
+    original_file_path = tmp_path / "original"
+    original_file_path.write_bytes(SAMPLE_MESSAGE)
+
+    with open(original_file_path, "rb") as original_file:
+        handle = create_handler(
+            VerifyContext(
+                signature_file=BytesIO(message_signature),
+                original_file=original_file,
+                key_id=KEY_ID,
+                chunk_length=0,
+            )
+        )
+        handle()
@@ -0,0 +1,47 @@
+from io import BytesIO
+
+import pytest
+from gnukek.exceptions import DecryptionError
+from gnukek.utils import PreprocessedEncryptedStream
+
+from gnukek_cli.crypto.envelope import (
+    EnvelopeHeader,
+    Recipient,
+    is_envelope,
+    read_encrypted_stream_header,
+)
+from tests.constants import KEY_ID_BYTES
+
+SAMPLE_HEADER = EnvelopeHeader(
+    [Recipient(KEY_ID_BYTES, b"a" * 256), Recipient(b"b" * 8, b"b" * 512)]
+)
+
+
+def test_envelope_header_roundtrip():
+    serialized_header = SAMPLE_HEADER.serialize()
+    assert is_envelope(serialized_header)
+
+    encrypted_stream = BytesIO(serialized_header + b"body")
+    header = read_encrypted_stream_header(encrypted_stream)
+
+    assert header == SAMPLE_HEADER
+    assert encrypted_stream.read() == b"body"
+
+
+def test_read_kek_stream_header(encrypted_message):
+    header = read_encrypted_stream_header(BytesIO(encrypted_message))
+
+    assert isinstance(header, PreprocessedEncryptedStream)
+    assert header.algorithm_version == 1
+    assert header.key_id == KEY_ID_BYTES
+
+
+@pytest.mark.parametrize("data", [b"", b"\x01abc", SAMPLE_HEADER.serialize()[:-1]])
+def test_read_truncated_header(data):
+    with pytest.raises(DecryptionError):
+        read_encrypted_stream_header(BytesIO(data))
+
+
+def test_get_unknown_recipient():
+    with pytest.raises(DecryptionError):
+        SAMPLE_HEADER.get_recipient(b"c" * 8)
@@ -0,0 +1,60 @@
+import os
+from io import BytesIO
+
+import pytest
+from gnukek.constants import KEY_ID_SLICE
+from gnukek.exceptions import DecryptionError
+
+from gnukek_cli.crypto.symmetric import (
+    decrypt_chunk,
+    decrypt_stream_parallel,
+    get_wrapped_key_length,
+    unwrap_symmetric_key,
+)
+
+
+@pytest.fixture()
+def large_message():
+    return os.urandom(10_000)
+
+
+@pytest.fixture()
+def encrypted_large_message(sample_public_key, large_message):
+    encryptor = sample_public_key.get_encryptor()
+    return encryptor.get_metadata() + encryptor.encrypt(large_message)
+
+
+@pytest.fixture()
+def encrypted_body(sample_key_pair, encrypted_large_message):
+    wrapped_key_end = KEY_ID_SLICE.stop + get_wrapped_key_length(sample_key_pair)
+    symmetric_key = unwrap_symmetric_key(
+        sample_key_pair, encrypted_large_message[KEY_ID_SLICE.stop : wrapped_key_end]
+    )
+    return symmetric_key, encrypted_large_message[wrapped_key_end:]
+
+
+@pytest.mark.parametrize("chunk_length", [16, 64, 4096, 1024 * 1024])
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_decrypt_stream_parallel(chunk_length, jobs, encrypted_body, large_message):
+    symmetric_key, body = encrypted_body
+
+    decrypted_chunks = decrypt_stream_parallel(
+        symmetric_key, BytesIO(body), chunk_length=chunk_length, jobs=jobs
+    )
+
+    assert b"".join(decrypted_chunks) == large_message
+
+
+def test_decrypt_chunk_random_access(encrypted_body, large_message):
+    symmetric_key, body = encrypted_body
+
+    decrypted_chunk = decrypt_chunk(
+        symmetric_key, body[1024:2048], previous_block=body[1008:1024]
+    )
+
+    assert decrypted_chunk == large_message[1024:2048]
+
+
+def test_unwrap_symmetric_key_invalid(sample_key_pair):
+    with pytest.raises(DecryptionError):
+        unwrap_symmetric_key(sample_key_pair, b"invalid")
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from gnukek_cli.utils.files import atomic_write
+from tests.constants import SAMPLE_MESSAGE
+
+
+def test_atomic_write(tmp_path):
+    file_path = tmp_path / "file"
+    file_path.write_bytes(b"original")
+    file_path.chmod(0o640)
+
+    with atomic_write(file_path) as file:
+        file.write(SAMPLE_MESSAGE)
+        assert file_path.read_bytes() == b"original"
+
+    assert file_path.read_bytes() == SAMPLE_MESSAGE
+    assert os.listdir(tmp_path) == ["file"]
+    if os.name == "posix":
+        assert file_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_atomic_write_new_file(tmp_path):
+    file_path = tmp_path / "file"
+
+    with atomic_write(file_path) as file:
+        file.write(SAMPLE_MESSAGE)
+
+    assert file_path.read_bytes() == SAMPLE_MESSAGE
+
+
+def test_atomic_write_error(tmp_path):
+    file_path = tmp_path / "file"
+    file_path.write_bytes(b"original")
+
+    with pytest.raises(ValueError):
+        with atomic_write(file_path) as file:
+            file.write(SAMPLE_MESSAGE)
+            raise ValueError()
+
+    assert file_path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == ["file"]